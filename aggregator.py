@@ -247,14 +247,40 @@ class WorkingAggregator:
         workload_cols: List[str],
         days_per_year: int
     ) -> Dict[str, float]:
-        """Calculate total yearly workload for each brand."""
-        brand_totals = {}
-
-        for _, row in df.iterrows():
-            allocations = cls.allocate_row_brands(
-                row, brand_cols, workload_cols, days_per_year
-            )
-            for brand, allocated in allocations:
-                brand_totals[brand] = brand_totals.get(brand, 0) + allocated
+        """Calculate total yearly workload for each brand.
+
+        Vectorized equivalent of summing allocate_row_brands over every
+        row: a row's allocation is (workload / daily_sum) * daily_sum *
+        days_per_year, which reduces to workload * days_per_year, so the
+        per-brand totals come from one factorize + bincount pass over
+        the brand/workload matrices instead of a Python loop per row.
+        """
+        n_pairs = min(len(brand_cols), len(workload_cols))
+        if n_pairs == 0 or df.empty:
+            return {}
 
-        return brand_totals
\ No newline at end of file
+        # Standardize every brand cell in one pass (stringify non-null
+        # cells, strip/upper, null markers dropped), then factorize.
+        flat = df[brand_cols[:n_pairs]].to_numpy(dtype=object).ravel()
+        brands = pd.Series(np.where(pd.isna(flat), None, flat.astype(str)))
+        brands = brands.str.strip().str.upper()
+        brands = brands.where(~brands.isin(cls.NULL_VALUES))
+        codes, uniques = pd.factorize(brands)
+
+        workloads = (
+            df[workload_cols[:n_pairs]]
+            .apply(pd.to_numeric, errors="coerce")
+            .to_numpy(dtype=np.float64)
+            .ravel()
+        )
+        # A cell only contributes when it has both a brand and a
+        # positive workload — the same rule the row loop applied.
+        valid = (codes >= 0) & (workloads > 0)
+        totals = np.bincount(
+            codes[valid],
+            weights=workloads[valid] * days_per_year,
+            minlength=len(uniques),
+        )
+
+        present = np.unique(codes[valid])
+        return {uniques[c]: float(totals[c]) for c in present}
\ No newline at end of file
@@ -16,11 +16,32 @@ class AnalyzerConfig:
     test_price: float = 0.0
 
 class MarketAnalysisConfig:
-    def __init__(self, config_path: str = "config.json"):
+    def __init__(self, config_path: str = "config.json", *, loader=None, saver=None):
+        """Create the config manager.
+
+        loader/saver are injectable callables — loader(path) returns the
+        stored dict, saver(path, data) persists it. The defaults read
+        and write JSON files; tests pass plain dict callables to keep
+        configuration handling fully in memory.
+        """
         self.config_path = config_path
+        self._loader = loader if loader is not None else self._load_json
+        self._saver = saver if saver is not None else self._save_json
         self.config_data = self._load_default_config()
         self.load_config()
 
+    @staticmethod
+    def _load_json(path: str) -> Optional[Dict]:
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _save_json(path: str, data: Dict):
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
     def _load_default_config(self) -> Dict:
         """Load default configuration settings."""
         return {
@@ -57,20 +78,18 @@ class MarketAnalysisConfig:
         }
 
     def load_config(self):
-        """Load configuration from file."""
+        """Load configuration through the injected loader."""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    loaded_config = json.load(f)
-                    self.config_data.update(loaded_config)
+            loaded_config = self._loader(self.config_path)
+            if loaded_config:
+                self.config_data.update(loaded_config)
         except Exception as e:
             logger.error(f"Error loading config: {e}")
 
     def save_config(self):
-        """Save current configuration to file."""
+        """Save current configuration through the injected saver."""
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config_data, f, indent=2)
+            self._saver(self.config_path, self.config_data)
         except Exception as e:
             logger.error(f"Error saving config: {e}")
 
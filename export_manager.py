@@ -8,7 +8,9 @@ from openpyxl.utils.dataframe import dataframe_to_rows
 
 class ExportManager:
     def __init__(self, output_path: str):
-        self.output_path = output_path
+        # Normalize once at construction so save paths need no per-call
+        # os.path handling.
+        self.output_path = os.path.normpath(output_path)
 
     def export_results(
         self,
@@ -3,6 +3,7 @@
 import sys
 import os
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -37,6 +38,38 @@ def load_sheet_names(file_path: str) -> list:
         QMessageBox.critical(None, "Error", f"Failed to read sheet names: {str(e)}")
         return []
 
+@dataclass(frozen=True)
+class ProcessCtx:
+    """Inputs for one processing run, decoupled from widget state."""
+    input_path: str
+    output_path: str
+    sheet: str
+    analyzer: str
+    region: Optional[str] = None
+
+
+def process_data_pipeline(ctx: ProcessCtx, config: Dict) -> Dict[str, AnalysisResult]:
+    """Read, filter and analyze one dataset (no Qt access).
+
+    Returns one AnalysisResult per analyzer type; "Consolidated" runs
+    all three. Lives at module level so the processing logic can be
+    unit-tested without constructing the main window.
+    """
+    df = pd.read_excel(ctx.input_path, sheet_name=ctx.sheet)
+    df = df.replace(["NILL", "Nill", "nill", "NIL"], np.nan)
+
+    if ctx.region and "Region" in df.columns:
+        df = df[df["Region"] == ctx.region]
+
+    analyzers = ["IA", "CBC", "CHEM"] if ctx.analyzer == "Consolidated" else [ctx.analyzer]
+    return {
+        analyzer: WorkingAggregator.analyze_market_data(
+            df=df, config=config, analyzer_type=analyzer
+        )
+        for analyzer in analyzers
+    }
+
+
 class ModernMarketAnalyzer(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -243,21 +276,29 @@ class ModernMarketAnalyzer(QMainWindow):
 
             self.statusBar().showMessage("Processing data...")
 
-            # Read input data
-            df = self.read_input_data()
-            if df is None:
-                return
-
-            # Apply filters
-            df = self.apply_filters(df)
-
-            # Process based on analyzer type
-            analyzer_type = self.analyzer_combo.currentText()
-            if analyzer_type == "Consolidated":
-                self.process_consolidated(df)
-            else:
-                self.process_single_analyzer(df, analyzer_type)
-
+            # The widget state is snapshotted into a context object and
+            # the actual processing runs through the Qt-free pipeline.
+            region = self.region_combo.currentText()
+            ctx = ProcessCtx(
+                input_path=self.input_edit.text(),
+                output_path=self.output_edit.text(),
+                sheet=self.sheet_combo.currentText(),
+                analyzer=self.analyzer_combo.currentText(),
+                region=None if region == "All" else region,
+            )
+            results = process_data_pipeline(ctx, self.config.config_data)
+
+            for analyzer_type, result in results.items():
+                self.latest_results = result
+                self.update_results_display(result, analyzer_type)
+                self.save_results(result, analyzer_type)
+                self.update_visualizations(result, analyzer_type)
+
+            if ctx.analyzer == "Consolidated":
+                QMessageBox.information(
+                    self, "Processing Complete",
+                    "Consolidated processing completed successfully."
+                )
             self.statusBar().showMessage("Processing complete", 5000)
 
         except Exception as e:
@@ -265,64 +306,6 @@ class ModernMarketAnalyzer(QMainWindow):
             QMessageBox.critical(self, "Error", f"Error processing data: {str(e)}")
             self.statusBar().showMessage("Processing failed")
 
-    def process_single_analyzer(self, df: pd.DataFrame, analyzer_type: str):
-        """Process data for a single analyzer type."""
-        try:
-            # Get analysis results
-            results = WorkingAggregator.analyze_market_data(
-                df=df,
-                config=self.config.config_data,
-                analyzer_type=analyzer_type
-            )
-
-            # Store the latest results
-            self.latest_results = results
-
-            # Update results display
-            self.update_results_display(results, analyzer_type)
-
-            # Save results
-            self.save_results(results, analyzer_type)
-
-            # Update visualizations
-            self.update_visualizations(results, analyzer_type)
-
-        except Exception as e:
-            logger.error(f"Error processing {analyzer_type}: {str(e)}")
-            raise
-
-    def process_consolidated(self, df: pd.DataFrame):
-        """Process data in consolidated mode for all analyzers."""
-        try:
-            for analyzer_type in ["IA", "CBC", "CHEM"]:
-                results = WorkingAggregator.analyze_market_data(
-                    df=df,
-                    config=self.config.config_data,
-                    analyzer_type=analyzer_type
-                )
-
-                if results is None:
-                    logger.warning(f"No results for analyzer type: {analyzer_type}")
-                    continue
-
-                # Store the latest results (can be overwritten; consider storing separately if needed)
-                self.latest_results = results
-
-                # Update results display
-                self.update_results_display(results, analyzer_type)
-
-                # Save results
-                self.save_results(results, analyzer_type)
-
-                # Update visualizations
-                self.update_visualizations(results, analyzer_type)
-
-            QMessageBox.information(self, "Processing Complete", "Consolidated processing completed successfully.")
-
-        except Exception as e:
-            logger.error(f"Error in consolidated processing: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error in consolidated processing: {str(e)}")
-
     def update_results_display(self, results: AnalysisResult, analyzer_type: str):
         """Update the GUI with analysis results."""
         # Update volume market share
@@ -485,24 +468,6 @@ class ModernMarketAnalyzer(QMainWindow):
 
         return True
 
-    def read_input_data(self) -> Optional[pd.DataFrame]:
-        """Read and validate input Excel file."""
-        try:
-            df = pd.read_excel(
-                self.input_edit.text(),
-                sheet_name=self.sheet_combo.currentText()
-            )
-
-            # Replace null values
-            df = df.replace(["NILL", "Nill", "nill", "NIL"], np.nan)
-
-            return df
-
-        except Exception as e:
-            logger.error(f"Error reading input file: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to read input file: {str(e)}")
-            return None
-
     def apply_filters(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply selected filters to the dataset."""
         # Region filter
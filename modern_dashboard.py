@@ -1,14 +1,136 @@
 # modern_dashboard.py
+import os
+import json
+import hashlib
+import logging
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QComboBox, QPushButton, QFrame, QScrollArea, QTabWidget,
-    QGroupBox, QSplitter
+    QGroupBox, QSplitter, QFileDialog, QMessageBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+import matplotlib
+import pandas as pd
+import numpy as np
+
 from visualization import MarketShareVisualizer
 from modern_ui import ModernFrame, ModernButton
-import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class _LoadSignals(QObject):
+    """Signals used to marshal worker results back to the GUI thread."""
+
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class LoadWorker(QRunnable):
+    """Runs workbook parsing and total computation off the GUI thread."""
+
+    def __init__(self, loader, file_path: str):
+        super().__init__()
+        self.loader = loader
+        self.file_path = file_path
+        self.signals = _LoadSignals()
+
+    def run(self):
+        try:
+            df = self.loader(self.file_path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(df)
+
+
+class _TaskWorker(QRunnable):
+    """Runs an arbitrary no-argument task off the GUI thread."""
+
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+        self.signals = _LoadSignals()
+
+    def run(self):
+        try:
+            result = self.task()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+# Shared chart template, applied to the rcParams once at import so the
+# per-chart methods only set data and axis titles instead of re-stating
+# the same styling on every figure they build.
+CHART_RC = {
+    "figure.figsize": (10, 6),
+    "axes.titlesize": 12,
+    "axes.titleweight": "bold",
+    "axes.labelsize": 10,
+    "axes.grid": True,
+    "grid.alpha": 0.3,
+    "xtick.labelsize": 9,
+    "ytick.labelsize": 9,
+}
+matplotlib.rcParams.update(CHART_RC)
+
+
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _scatter_sums(codes, values, n_groups):
+        """Scatter-add rows of *values* into per-code accumulators."""
+        out = np.zeros((n_groups, values.shape[1]))
+        for j in prange(values.shape[1]):
+            for i in range(codes.shape[0]):
+                out[codes[i], j] += values[i, j]
+        return out
+
+except ImportError:
+    _scatter_sums = None
+
+
+def _group_sums(codes, values):
+    """Per-group row sums of *values* for integer group codes.
+
+    With numba installed, a parallel scatter-add kernel accumulates the
+    sums in one pass over the unsorted rows. Otherwise the rows are
+    stable-sorted by code and each run collapsed with a single
+    np.add.reduceat call — either way one allocation for the result
+    instead of the hash table and per-group Series machinery of a pandas
+    groupby. Returns (unique_codes, sums) in ascending code order.
+    """
+    if len(codes) == 0:
+        return codes, values[:0]
+    if _scatter_sums is not None:
+        uniques = np.unique(codes)
+        n_groups = int(codes.max()) + 1
+        sums = _scatter_sums(
+            np.ascontiguousarray(codes), np.ascontiguousarray(values), n_groups
+        )
+        return uniques, sums[uniques]
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.diff(sorted_codes, prepend=sorted_codes[0] - 1))
+    return sorted_codes[starts], np.add.reduceat(values[order], starts, axis=0)
+
+
+# Index levels of the cached aggregate built once per dataset load.
+GROUP_KEYS = ["Region", "Type", "Class", "CITY", "Customer Name"]
+VALUE_COLS = ["CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL", "TOTAL_SAMPLES"]
+
 
 class AnalysisDashboard(QMainWindow):
     """Main dashboard window for market share analysis."""
@@ -17,6 +139,41 @@ class AnalysisDashboard(QMainWindow):
         super().__init__()
         self.config_manager = config_manager
         self.visualizer = MarketShareVisualizer()
+
+        self.data = None
+        self.filtered_data = None
+        # Single aggregate over all grouping keys, built once per load;
+        # every chart answers from a slice of it instead of re-scanning
+        # the raw rows on each filter change.
+        self._work = None
+        self._agg = None
+        self._agg_f = None
+        self._long = None
+        # SoA views of the filtered rows, rebuilt by apply_filters.
+        self._numeric = None
+        self._codes = {}
+        # Per-chart aggregation results memoized on (title, region, type);
+        # _sel is the GUI-thread snapshot of the active filter selection.
+        self._chart_cache = {}
+        self._sel = ("All", "All")
+        # Memoized groupby objects keyed on (frame identity, group key);
+        # charts sharing a key reuse the computed group indices.
+        self._gb_cache = {}
+        # Charts whose displayed state is stale for the current filters,
+        # and the last rendered figure per chart title.
+        self._dirty = set()
+        self._figures = {}
+        # One canvas widget is shared by every chart tab; it is reparented
+        # into the visible tab instead of keeping 16 canvases alive.
+        self._canvas = None
+        # Chart titles whose on-disk PNG already matches the current figure.
+        self._png_clean = set()
+        self._source_path = ""
+
+        self.output_dir = os.path.join(os.getcwd(), "Output")
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._out = self.output_dir + os.sep
+
         self.init_ui()
 
     def init_ui(self):
@@ -36,9 +193,8 @@ class AnalysisDashboard(QMainWindow):
         # Create tab widget for different views
         tab_widget = QTabWidget()
         tab_widget.addTab(self.create_overview_tab(), "Overview")
+        tab_widget.addTab(self.create_charts_tab(), "Charts")
         tab_widget.addTab(self.create_detailed_analysis_tab(), "Detailed Analysis")
-        tab_widget.addTab(self.create_regional_analysis_tab(), "Regional Analysis")
-        tab_widget.addTab(self.create_trends_tab(), "Trends")
 
         main_layout.addWidget(tab_widget)
 
@@ -67,25 +223,30 @@ class AnalysisDashboard(QMainWindow):
         region_group.setLayout(region_layout)
         layout.addWidget(region_group)
 
-        # Time period selection
-        period_group = QGroupBox("Time Period")
-        period_layout = QVBoxLayout()
-        self.period_combo = QComboBox()
-        self.period_combo.addItems(["Current", "Last Month", "Last Quarter", "YTD"])
-        period_layout.addWidget(self.period_combo)
-        period_group.setLayout(period_layout)
-        layout.addWidget(period_group)
+        # Type selection
+        type_group = QGroupBox("Type")
+        type_layout = QVBoxLayout()
+        self.type_combo = QComboBox()
+        self.type_combo.addItems(["All"] + self.config_manager.config_data["metadata"]["types"])
+        self.type_combo.currentTextChanged.connect(self.update_dashboard)
+        type_layout.addWidget(self.type_combo)
+        type_group.setLayout(type_layout)
+        layout.addWidget(type_group)
 
         # Action buttons
         button_group = QGroupBox("Actions")
         button_layout = QHBoxLayout()
 
+        open_btn = ModernButton("Open Dataset")
+        open_btn.clicked.connect(self.browse_dataset)
+
         refresh_btn = ModernButton("Refresh")
         refresh_btn.clicked.connect(self.refresh_data)
 
         export_btn = ModernButton("Export Report")
         export_btn.clicked.connect(self.export_report)
 
+        button_layout.addWidget(open_btn)
         button_layout.addWidget(refresh_btn)
         button_layout.addWidget(export_btn)
         button_group.setLayout(button_layout)
@@ -125,6 +286,61 @@ class AnalysisDashboard(QMainWindow):
 
         return tab
 
+    def create_charts_tab(self) -> QWidget:
+        """Create the tabbed chart area, one sub-tab per chart."""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        # The homogeneous bar charts come from the _CHART_SPECS table and
+        # share one renderer; the remaining entries have bespoke code.
+        bespoke = {
+            "Samples Histogram": self.show_histogram,
+            "Region-Type Heatmap": self.show_heatmap_chart,
+            "Top 10 Chemistry": self.show_top_chemistry_chart,
+            "Bottom 10 Chemistry": self.show_bottom_chemistry_chart,
+            "Top 10 Immunoassay": self.show_top_immunoassay_chart,
+            "Bottom 10 Immunoassay": self.show_bottom_immunoassay_chart,
+            "Top 10 CBC": self.show_top_cbc_chart,
+            "Bottom 10 CBC": self.show_bottom_cbc_chart,
+            "Metric Share": self.show_metric_share_chart,
+            "Top 10 Customers": self.show_top_customers_chart,
+        }
+        self.charts = {
+            title: (
+                partial(self._render_bar_spec, title)
+                if title in self._CHART_SPECS
+                else bespoke[title]
+            )
+            for title in [
+                "Region Totals", "Type-wise Tests", "Samples Histogram",
+                "Region-Type Heatmap", "City-wise Totals",
+                "Class-wise Distribution",
+                "Top 10 Chemistry", "Bottom 10 Chemistry",
+                "Top 10 Immunoassay", "Bottom 10 Immunoassay",
+                "Top 10 CBC", "Bottom 10 CBC",
+                "Region Customer Count", "Metric Mix by Region",
+                "Metric Share", "Top 10 Customers",
+            ]
+        }
+
+        self.tabs = QTabWidget()
+        self.chart_boxes = {}
+        for title in self.charts:
+            self.tabs.addTab(self.create_chart_box(title), title)
+        # Only the visible tab is rendered; the rest stay marked dirty
+        # until the user switches to them.
+        self.tabs.currentChanged.connect(self._render_current)
+        layout.addWidget(self.tabs)
+
+        return tab
+
+    def create_chart_box(self, title: str) -> QWidget:
+        """Create the container widget that holds one chart canvas."""
+        box = QWidget()
+        box_layout = QVBoxLayout(box)
+        self.chart_boxes[title] = box_layout
+        return box
+
     def create_detailed_analysis_tab(self) -> QWidget:
         """Create the detailed analysis tab."""
         tab = QWidget()
@@ -147,22 +363,739 @@ class AnalysisDashboard(QMainWindow):
         layout.addWidget(splitter)
         return tab
 
-    def update_dashboard(self):
-        """Update all dashboard components with new data."""
+    # ------------------------------------------------------------------
+    # Data loading and filtering
+    # ------------------------------------------------------------------
+
+    def _metric_columns(self):
+        """Map each *_TOTAL column to its configured workload columns."""
+        analyzers = self.config_manager.config_data["analyzers"]
+        return {
+            "CHEM_TOTAL": analyzers["CHEM"]["workload_columns"],
+            "IA_TOTAL": analyzers["IA"]["workload_columns"],
+            "CBC_TOTAL": analyzers["CBC"]["workload_columns"],
+        }
+
+    def browse_dataset(self):
+        """Select and load an input Excel dataset."""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Select Input Excel File", "", "Excel Files (*.xlsx *.xls)"
+        )
+        if path:
+            self.load_dataset(path)
+
+    # Row batch size for the streaming reader; bounds per-batch memory.
+    CHUNK_ROWS = 50_000
+
+    def _used_columns(self):
+        """Columns the dashboard actually consumes from the input sheet."""
+        cols = list(GROUP_KEYS)
+        for workload_cols in self._metric_columns().values():
+            cols.extend(workload_cols)
+        return cols
+
+    def _iter_excel_chunks(self, file_path: str):
+        """Stream the first sheet in row batches of CHUNK_ROWS.
+
+        Each batch is projected down to the columns the dashboard uses, so
+        peak memory scales with the batch size and the used columns rather
+        than the full sheet.
+        """
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            used_set = set(self._used_columns())
+            used = [c for c in header if c in used_set] or list(header)
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.CHUNK_ROWS:
+                    yield pd.DataFrame(batch, columns=header)[used]
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=header)[used]
+        finally:
+            wb.close()
+
+    def _cache_paths(self, file_path: str):
+        """Parquet cache file and its sidecar manifest for a source path."""
+        digest = hashlib.md5(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        base = os.path.join(self.output_dir, ".cache", digest)
+        return base + ".parquet", base + ".json"
+
+    def _read_cached(self, file_path: str):
+        """Return the cached frame if the source file is unchanged."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None
+        parquet_path, manifest_path = self._cache_paths(file_path)
+        try:
+            stat = os.stat(file_path)
+            with open(manifest_path) as fh:
+                manifest = json.load(fh)
+            if manifest != {"mtime": stat.st_mtime, "size": stat.st_size}:
+                return None
+            return pd.read_parquet(parquet_path)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, file_path: str, data: pd.DataFrame):
+        """Persist the raw frame so the next load skips the Excel parse."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return
+        parquet_path, manifest_path = self._cache_paths(file_path)
+        try:
+            stat = os.stat(file_path)
+            os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+            data.to_parquet(parquet_path, compression="zstd")
+            with open(manifest_path, "w") as fh:
+                json.dump({"mtime": stat.st_mtime, "size": stat.st_size}, fh)
+        except Exception:
+            # A failed cache write only costs the next load a re-parse.
+            logging.debug("Parquet cache write failed for %s", file_path)
+
+    def _read_workbook(self, file_path: str) -> pd.DataFrame:
+        """Read the first sheet without building a full workbook DOM.
+
+        A Parquet copy of each parsed sheet is kept under the output
+        directory; while the source file's mtime and size match the
+        sidecar manifest, reloads come from Parquet instead of re-parsing
+        the Excel file. Cold reads prefer the calamine engine when
+        installed; otherwise they stream row batches through openpyxl's
+        read_only mode, which avoids materializing the whole workbook
+        before the first row. Falls back to the default pandas reader for
+        formats neither path handles.
+        """
+        cached = self._read_cached(file_path)
+        if cached is not None:
+            return cached
+        data = None
+        try:
+            data = pd.read_excel(file_path, sheet_name=0, engine="calamine")
+        except ImportError:
+            pass
+        if data is None:
+            try:
+                chunks = list(self._iter_excel_chunks(file_path))
+            except Exception:
+                chunks = None
+            if chunks is None:
+                data = pd.read_excel(file_path, sheet_name=0)
+            elif chunks:
+                data = pd.concat(chunks, ignore_index=True)
+            else:
+                data = pd.DataFrame()
+        self._write_cache(file_path, data)
+        return data
+
+    def load_dataset(self, file_path: str):
+        """Load the dataset on a worker thread, keeping the UI responsive."""
+        worker = LoadWorker(self._prepare_dataframe, file_path)
+        worker.signals.finished.connect(
+            lambda df, path=file_path: self._on_dataset_loaded(df, path)
+        )
+        worker.signals.error.connect(self._on_dataset_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _prepare_dataframe(self, file_path: str) -> pd.DataFrame:
+        """Read the workbook and compute metric totals (no Qt access)."""
+        data = self._read_workbook(file_path)
+        data = data.replace(["NILL", "Nill", "nill", "NIL"], np.nan)
+
+        # Downcast the workload columns to float32 (halves the bytes moved
+        # by every aggregation) and code the grouping keys as categories so
+        # groupby hashes integer codes instead of Python strings.
+        for workload_cols in self._metric_columns().values():
+            for col in workload_cols:
+                if col in data.columns:
+                    data[col] = pd.to_numeric(data[col], errors="coerce").astype("float32")
+        for col in ["Region", "Type", "Class", "CITY", "Customer Name"]:
+            if col in data.columns:
+                data[col] = data[col].astype("category")
+
+        # One C-level reduction per metric group instead of chained Series
+        # additions that each allocate an intermediate and re-check NaNs.
+        # The explicit float32 casts pin the *_TOTAL dtype regardless of
+        # how the reduction above is computed; per-site yearly volumes
+        # stay well inside float32's exact integer range, and the half-
+        # width columns halve the bytes every later aggregation streams.
+        for total_col, workload_cols in self._metric_columns().items():
+            cols = [c for c in workload_cols if c in data.columns]
+            if cols:
+                vals = data[cols].to_numpy(dtype=np.float32, copy=False)
+                data[total_col] = np.nansum(vals, axis=1).astype(np.float32, copy=False)
+            else:
+                data[total_col] = np.float32(0.0)
+        data["TOTAL_SAMPLES"] = np.add.reduce(
+            data[["CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL"]].to_numpy(copy=False),
+            axis=1,
+        ).astype(np.float32, copy=False)
+        return data
+
+    def _on_dataset_loaded(self, data: pd.DataFrame, file_path: str):
+        """Install the prepared frame and refresh the dashboard (GUI thread)."""
+        self.data = data
+        self._source_path = file_path
+
+        # Working frame: only the rows with any recorded samples and only
+        # the columns the charts read. Every filter pass and chart scans
+        # this projection instead of the full input sheet.
+        active = data["TOTAL_SAMPLES"].to_numpy() > 0
+        keep = [c for c in GROUP_KEYS + VALUE_COLS if c in data.columns]
+        self._work = data.loc[active, keep]
+
+        # One aggregation pass serves every grouped chart; filter changes
+        # slice this table instead of re-aggregating the raw rows.
+        self._agg = self._work.groupby(
+            GROUP_KEYS, observed=True, sort=False
+        )[VALUE_COLS].sum()
+        # Long-form (key, metric, value) layout built once per load; the
+        # region/metric charts share a single groupby over it instead of
+        # re-hashing the key column once per chart.
+        self._long = self._work[
+            ["Region", "Type", "CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL"]
+        ].melt(id_vars=["Region", "Type"], var_name="Metric", value_name="Value")
+        self._chart_cache.clear()
+
+        logger.info(f"Loaded dataset: {file_path} ({len(self.data)} rows)")
+        self.update_dashboard()
+
+    def _on_dataset_error(self, message: str):
+        logger.error(f"Error loading dataset: {message}")
+        QMessageBox.critical(self, "Error", f"Failed to load dataset:\n{message}")
+
+    def apply_filters(self):
+        """Apply the region/type filter selection to the working frames."""
+        # Snapshot the combo state once on the GUI thread; the cache keys
+        # and warm-pool builders read this tuple, not the widgets.
+        region = self.region_combo.currentText()
+        type_ = self.type_combo.currentText()
+        self._sel = (region, type_)
+
+        # Build one combined mask and take a single selection; downstream
+        # code only reads the filtered frame, so no defensive copies.
+        row_mask = np.ones(len(self._work), dtype=bool)
+        if region != "All":
+            row_mask &= self._work["Region"].to_numpy() == region
+        if type_ != "All":
+            row_mask &= self._work["Type"].to_numpy() == type_
+        self.filtered_data = self._work.iloc[row_mask]
+
+        # The cached aggregate is filtered on its index levels, never rebuilt.
+        mask = np.ones(len(self._agg), dtype=bool)
+        if region != "All":
+            mask &= self._agg.index.get_level_values("Region") == region
+        if type_ != "All":
+            mask &= self._agg.index.get_level_values("Type") == type_
+        self._agg_f = self._agg[mask]
+        # Groupby objects hold row indices for a specific frame; a new
+        # selection invalidates them (keys reuse id() of dropped frames).
+        self._gb_cache.clear()
+
+        # Structure-of-arrays view of the filtered rows: one float64
+        # matrix of the metric columns plus the category codes of each
+        # single grouping key. The grouped charts reduce these flat
+        # arrays through _group_sums without touching the frame again;
+        # the codes come straight off the categorical columns.
+        self._numeric = self.filtered_data[VALUE_COLS].to_numpy(dtype=np.float64)
+        self._codes = {
+            col: (
+                self.filtered_data[col].cat.codes.to_numpy(),
+                self.filtered_data[col].cat.categories,
+            )
+            for col in ("Region", "Type", "Class", "CITY", "Customer Name")
+            if col in self.filtered_data.columns
+        }
+
+    def _soa_sums(self, key: str, columns) -> pd.DataFrame:
+        """Grouped sums over the SoA arrays for one grouping key."""
+        codes, categories = self._codes[key]
+        keep = codes >= 0
+        col_idx = [VALUE_COLS.index(c) for c in columns]
+        kept, sums = _group_sums(codes[keep], self._numeric[keep][:, col_idx])
+        data = pd.DataFrame(sums, columns=list(columns))
+        data.insert(0, key, np.asarray(categories)[kept])
+        return data
+
+    def _cache_key(self, title: str):
+        """Cache key tying a chart's data to the current filter selection."""
+        return (title,) + self._sel
+
+    def _chart_data(self, title: str, builder):
+        """Memoize a chart's aggregation for the current filter selection."""
+        key = self._cache_key(title)
+        if key not in self._chart_cache:
+            self._chart_cache[key] = builder()
+        return self._chart_cache[key]
+
+    def _grouped(self, key):
+        """Memoized groupby of the filtered frame for a group key.
+
+        Grouping computes and stores the per-group row indices; caching
+        the groupby object lets every chart that groups on the same key
+        reuse those indices instead of re-hashing the column.
+        """
+        cache_key = (id(self.filtered_data), key if isinstance(key, str) else tuple(key))
+        gb = self._gb_cache.get(cache_key)
+        if gb is None:
+            gb = self.filtered_data.groupby(key, observed=True, sort=False)
+            self._gb_cache[cache_key] = gb
+        return gb
+
+    # Cache title -> builder method for every aggregation the charts read;
+    # _warm_chart_cache runs these concurrently after a filter change.
+    _WARM_BUILDERS = {
+        "_region_metric": "_build_region_metric",
+        "Type-wise Tests": "_build_type_totals",
+        "Region-Type Heatmap": "_build_heatmap",
+        "City-wise Totals": "_build_city_totals",
+        "Class-wise Distribution": "_build_class_totals",
+        "Region Customer Count": "_build_customer_counts",
+    }
+    _RANKED_COLUMNS = ("CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL", "TOTAL_SAMPLES")
+
+    def _warm_chart_cache(self):
+        """Fill the chart-data cache for the current filters concurrently.
+
+        The builders are pure pandas/numpy over the filtered frames and
+        touch no Qt state, so they can run on a small thread pool; the
+        GUI thread then only assembles figures from cached results.
+        """
+        jobs = []
+        for title, name in self._WARM_BUILDERS.items():
+            key = self._cache_key(title)
+            if key not in self._chart_cache:
+                jobs.append((key, getattr(self, name)))
+        for column in self._RANKED_COLUMNS:
+            key = self._cache_key("_rank:" + column)
+            if key not in self._chart_cache:
+                jobs.append((key, lambda col=column: self._rank_compute(col)))
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=min(4, len(jobs))) as pool:
+            futures = [(key, pool.submit(builder)) for key, builder in jobs]
+            for key, future in futures:
+                try:
+                    self._chart_cache[key] = future.result()
+                except Exception:
+                    # A failed warm just means the chart rebuilds its data
+                    # on the GUI thread when its tab is shown.
+                    logger.exception("Chart cache warm failed for %s", key[0])
+
+    # ------------------------------------------------------------------
+    # Chart rendering
+    # ------------------------------------------------------------------
+
+    def show_charts(self):
+        """Mark every chart stale and render only the visible one."""
+        self._dirty = set(self.charts)
+        self._png_clean.clear()
+        self._warm_chart_cache()
+        self._render_current()
+
+    def _render_current(self, index=None):
+        """Render the currently visible chart tab if it is stale."""
+        if self.data is None:
+            return
+        title = self.tabs.tabText(self.tabs.currentIndex())
+        if title in self._dirty or title not in self._figures:
+            self.charts[title]()
+            self._dirty.discard(title)
+        else:
+            # Already rendered for these filters; just move the shared
+            # canvas into this tab and point it at the cached figure.
+            self._install_canvas(self._figures[title], title)
+
+    def _install_canvas(self, fig: Figure, title: str):
+        """Show a figure on the shared canvas inside the given tab."""
+        if self._canvas is None:
+            self._canvas = FigureCanvas(fig)
+        else:
+            self._canvas.figure = fig
+            fig.set_canvas(self._canvas)
+        # addWidget reparents the canvas out of whichever tab held it.
+        self.chart_boxes[title].addWidget(self._canvas)
+        self._canvas.draw_idle()
+
+    def generate_chart(self, fig: Figure, title: str):
+        """Register a figure, installing it only if its tab is visible.
+
+        Off-screen renders (the export pre-render loop) just record the
+        figure; installing would drag the shared canvas through every
+        tab and leave it in the last one.
+        """
+        self._figures[title] = fig
+        if self.tabs.tabText(self.tabs.currentIndex()) == title:
+            self._install_canvas(fig, title)
+
+    def export_chart_to_png(self, fig: Figure, title: str):
+        """Write one chart figure to the output directory as PNG."""
+        # Give the figure a private Agg canvas for the export so the
+        # shared Qt canvas (which may show a different figure) is not used.
+        prev_canvas = fig.canvas
+        FigureCanvasAgg(fig)
         try:
-            analyzer_type = self.analyzer_combo.currentText()
-            region = self.region_combo.currentText()
+            fig.savefig(f"{self._out}{self._slug(title)}.png", dpi=100)
+        finally:
+            if prev_canvas is not None:
+                fig.set_canvas(prev_canvas)
+
+    @staticmethod
+    def _slug(title: str) -> str:
+        return title.lower().replace(" ", "_").replace("-", "_")
+
+    def _build_region_metric(self):
+        """Region x Metric sums shared by the three metric charts.
+
+        A single hash pass over the long-form table answers the Region
+        Totals, Metric Mix, and Metric Share charts.
+        """
+        long = self._long
+        mask = np.ones(len(long), dtype=bool)
+        region, type_ = self._sel
+        if region != "All":
+            mask &= long["Region"].to_numpy() == region
+        if type_ != "All":
+            mask &= long["Type"].to_numpy() == type_
+        table = (
+            long.iloc[mask]
+            .groupby(["Region", "Metric"], observed=True)["Value"]
+            .sum()
+            .unstack(fill_value=0)
+        )
+        return table.reindex(columns=["CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL"], fill_value=0)
+
+    def _region_metric_table(self):
+        return self._chart_data("_region_metric", self._build_region_metric)
+
+    # Declarative specs for the homogeneous bar charts. Each entry maps
+    # a tab title to its cached data source plus the handful of knobs
+    # (x column, stacking, labels, tick rotation) that distinguish the
+    # charts; _render_bar_spec turns a spec into a figure. Everything
+    # else about the look comes from the shared CHART_RC template.
+    _CHART_SPECS = {
+        "Region Totals": {
+            "data": ("_region_metric", "_build_region_metric"),
+            "ylabel": "Yearly Tests", "rot": 45,
+        },
+        "Type-wise Tests": {
+            "data": ("Type-wise Tests", "_build_type_totals"),
+            "x": "Type", "ylabel": "Yearly Tests", "rot": 45, "legend": False,
+        },
+        "City-wise Totals": {
+            "data": ("City-wise Totals", "_build_city_totals"),
+            "x": "CITY", "ylabel": "Yearly Tests", "rot": 45,
+        },
+        "Class-wise Distribution": {
+            "data": ("Class-wise Distribution", "_build_class_totals"),
+            "x": "Class", "stacked": True, "ylabel": "Yearly Tests",
+        },
+        "Region Customer Count": {
+            "data": ("Region Customer Count", "_build_customer_counts"),
+            "ylabel": "Customers", "legend": False,
+        },
+        "Metric Mix by Region": {
+            "data": ("_region_metric", "_build_region_metric"),
+            "stacked": True, "ylabel": "Yearly Tests",
+        },
+    }
+
+    def _render_bar_spec(self, title: str):
+        """Render one spec-table bar chart into its tab."""
+        spec = self._CHART_SPECS[title]
+        cache_title, builder = spec["data"]
+        data = self._chart_data(cache_title, getattr(self, builder))
+        fig = Figure()
+        ax = fig.add_subplot(111)
+        if len(data.index) == 0:
+            # A filter combination can legitimately match nothing; show
+            # an empty titled chart instead of letting plot() raise.
+            ax.set_title(title)
+            self.generate_chart(fig, title)
+            return
+        plot_kwargs = {"kind": "bar", "stacked": spec.get("stacked", False), "ax": ax}
+        if "x" in spec:
+            plot_kwargs["x"] = spec["x"]
+        data.plot(legend=spec.get("legend", True), **plot_kwargs)
+        ax.set_title(title)
+        ax.set_ylabel(spec["ylabel"])
+        if "rot" in spec:
+            ax.tick_params(axis="x", rotation=spec["rot"])
+        fig.tight_layout()
+        self.generate_chart(fig, title)
+
+    def _build_type_totals(self):
+        return self._soa_sums("Type", ["TOTAL_SAMPLES"])
 
-            # Update visualizations
-            self.update_market_share_chart(analyzer_type, region)
-            self.update_regional_chart(analyzer_type, region)
-            self.update_brand_chart(analyzer_type, region)
-            self.update_class_chart(analyzer_type, region)
+    def show_histogram(self):
+        """Distribution of per-site total samples."""
+        # Bin once in numpy and hand the renderer 30 bar heights instead
+        # of the full sample column.
+        vals = self.filtered_data["TOTAL_SAMPLES"].to_numpy()
+        counts, edges = np.histogram(vals, bins=30) if len(vals) else (
+            np.zeros(30, dtype=int), np.linspace(0.0, 1.0, 31)
+        )
+        fig = Figure()
+        ax = fig.add_subplot(111)
+        ax.bar((edges[:-1] + edges[1:]) / 2, counts, width=np.diff(edges))
+        if len(vals):
+            ax.axvline(vals.mean(), color="tab:red", linestyle="--", label="Mean")
+            ax.axvline(np.median(vals), color="tab:green", linestyle="--", label="Median")
+            ax.legend()
+        ax.set_title("Samples Histogram")
+        ax.set_xlabel("Total Samples")
+        ax.set_ylabel("Sites")
+        fig.tight_layout()
+        self.generate_chart(fig, "Samples Histogram")
 
+    def _build_heatmap(self):
+        # groupby + unstack skips pivot_table's aggfunc dispatch and the
+        # intermediate NaN frame that fillna would have to rewrite.
+        return self._grouped(["Region", "Type"])["TOTAL_SAMPLES"].sum().unstack(fill_value=0)
+
+    def show_heatmap_chart(self):
+        """Region by type heatmap of total samples."""
+        pivot = self._chart_data("Region-Type Heatmap", self._build_heatmap)
+        fig = Figure()
+        ax = fig.add_subplot(111)
+        im = ax.imshow(pivot.to_numpy(), aspect="auto", cmap="Blues")
+        ax.set_xticks(range(len(pivot.columns)))
+        ax.set_xticklabels(pivot.columns, rotation=45)
+        ax.set_yticks(range(len(pivot.index)))
+        ax.set_yticklabels(pivot.index)
+        ax.set_title("Region-Type Heatmap")
+        fig.colorbar(im, ax=ax)
+        fig.tight_layout()
+        self.generate_chart(fig, "Region-Type Heatmap")
+
+    # Cities drawn in the city-wise chart; bounds the number of bar
+    # artists the canvas has to paint on every refresh.
+    MAX_CITIES = 30
+
+    def _build_city_totals(self):
+        data = self._soa_sums("CITY", ["CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL"])
+        if len(data) > self.MAX_CITIES:
+            totals = data[["CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL"]].sum(axis=1).to_numpy()
+            keep = np.argpartition(totals, len(totals) - self.MAX_CITIES)[-self.MAX_CITIES:]
+            data = data.iloc[keep[np.argsort(totals[keep])[::-1]]]
+        return data
+
+    def _build_class_totals(self):
+        return self._soa_sums("Class", ["CHEM_TOTAL", "IA_TOTAL", "CBC_TOTAL"])
+
+    def _rank_compute(self, column: str):
+        """Rank customers on a metric, serving its Top and Bottom chart.
+
+        The metric is first summed per customer through the grouped-sum
+        kernel, then a single O(N) argpartition pass picks both ends of
+        the aggregated series — no full sort of all customers. Returns
+        ((top_labels, top_values), (bottom_labels, bottom_values)).
+        """
+        codes, names = self._codes["Customer Name"]
+        keep = codes >= 0
+        col_vals = self._numeric[keep, VALUE_COLS.index(column):VALUE_COLS.index(column) + 1]
+        kept, sums = _group_sums(codes[keep], col_vals)
+        vals = sums[:, 0]
+        labels = np.asarray(names)[kept]
+        n = len(vals)
+        k = min(10, n)
+        if n <= 10:
+            order = np.argsort(vals)
+            top, bottom = order[::-1], order
+        else:
+            idx = np.argpartition(vals, (k - 1, n - k))
+            bottom = idx[:k][np.argsort(vals[idx[:k]])]
+            top_part = idx[-k:]
+            top = top_part[np.argsort(vals[top_part])[::-1]]
+        return (labels[top], vals[top]), (labels[bottom], vals[bottom])
+
+    def _rank_for(self, column: str):
+        """Top/bottom-10 row positions for a metric column, cached per filter."""
+        return self._chart_data("_rank:" + column, lambda: self._rank_compute(column))
+
+    def _show_ranked_chart(self, title: str, column: str, top: bool):
+        """Shared renderer for the Top/Bottom 10 customer charts."""
+        top_data, bottom_data = self._rank_for(column)
+        labels, values = top_data if top else bottom_data
+        fig = Figure()
+        ax = fig.add_subplot(111)
+        ax.barh(labels, values)
+        ax.invert_yaxis()
+        ax.set_title(title)
+        ax.set_xlabel("Yearly Tests")
+        fig.tight_layout()
+        self.generate_chart(fig, title)
+
+    def show_top_chemistry_chart(self):
+        self._show_ranked_chart("Top 10 Chemistry", "CHEM_TOTAL", top=True)
+
+    def show_bottom_chemistry_chart(self):
+        self._show_ranked_chart("Bottom 10 Chemistry", "CHEM_TOTAL", top=False)
+
+    def show_top_immunoassay_chart(self):
+        self._show_ranked_chart("Top 10 Immunoassay", "IA_TOTAL", top=True)
+
+    def show_bottom_immunoassay_chart(self):
+        self._show_ranked_chart("Bottom 10 Immunoassay", "IA_TOTAL", top=False)
+
+    def show_top_cbc_chart(self):
+        self._show_ranked_chart("Top 10 CBC", "CBC_TOTAL", top=True)
+
+    def show_bottom_cbc_chart(self):
+        self._show_ranked_chart("Bottom 10 CBC", "CBC_TOTAL", top=False)
+
+    def _build_customer_counts(self):
+        # Both columns are categorical, so the groupby dispatches on
+        # integer codes and nunique dedupes int32 codes, not strings.
+        return self._grouped("Region")["Customer Name"].nunique()
+
+    def show_metric_share_chart(self):
+        """Overall share of CHEM/IA/CBC volume."""
+        data = self._region_metric_table().sum(axis=0)
+        fig = Figure(figsize=(8, 8))
+        ax = fig.add_subplot(111)
+        ax.pie(data.values, labels=["Chemistry", "Immunoassay", "CBC"], autopct="%1.1f%%")
+        ax.set_title("Metric Share")
+        self.generate_chart(fig, "Metric Share")
+
+    def show_top_customers_chart(self):
+        """Top 10 customers by overall volume."""
+        self._show_ranked_chart("Top 10 Customers", "TOTAL_SAMPLES", top=True)
+
+    # ------------------------------------------------------------------
+    # Actions
+    # ------------------------------------------------------------------
+
+    def update_dashboard(self):
+        """Update all dashboard components with new data."""
+        if self.data is None:
+            return
+        try:
+            self.apply_filters()
+            self.show_charts()
         except Exception as e:
             self.show_error_message(f"Error updating dashboard: {str(e)}")
 
+    def refresh_data(self):
+        """Reload the current dataset from disk."""
+        if not self._source_path:
+            QMessageBox.information(self, "No Data", "Please open a dataset first.")
+            return
+        self.load_dataset(self._source_path)
+
+    def export_report(self):
+        """Export all charts as a PDF report."""
+        if self.data is None:
+            QMessageBox.information(self, "No Data", "Please open a dataset first.")
+            return
+        self.export_to_pdf()
+
+    def export_to_pdf(self):
+        """Build the PDF report on a worker thread, notifying when done.
+
+        The charts are brought up to date here on the GUI thread (stale
+        ones are rebuilt without touching the shared canvas); the PNG
+        rasterization and PDF composition — the slow, Qt-free part —
+        then runs on the thread pool over detached figure copies and
+        reports back via signals, keeping the window responsive.
+        """
+        for title, method in self.charts.items():
+            if title in self._dirty or title not in self._figures:
+                method()
+                self._dirty.discard(title)
+        # The worker gets detached deep copies: the live figures stay
+        # with the GUI thread (which may be repainting them), and the
+        # export renders figures nothing else owns. Pickling strips the
+        # Qt canvas; the export path attaches its own Agg canvases.
+        figures = {
+            title: pickle.loads(pickle.dumps(self._figures[title]))
+            for title in self.charts
+        }
+        stale = [t for t in self.charts if t not in self._png_clean]
+        self._png_clean = set(self.charts)
+
+        worker = _TaskWorker(lambda: self._write_report(figures, stale))
+        worker.signals.finished.connect(self._on_export_done)
+        worker.signals.error.connect(self._on_export_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _write_report(self, figures, stale):
+        """Write the chart PNGs and the combined PDF (no Qt access).
+
+        Failures are collected per chart and reported once at the end
+        instead of interrupting the export with a dialog per file.
+        """
+        failed = []
+        # Agg rasterization releases the GIL for most of each write, so
+        # the stale PNGs are exported concurrently.
+        with ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(figures))
+        ) as pool:
+            futures = [
+                (title, pool.submit(self.export_chart_to_png, figures[title], title))
+                for title in stale
+            ]
+            for title, future in futures:
+                if future.exception() is not None:
+                    logger.error(f"PNG export failed for {title}: {future.exception()}")
+                    failed.append(title)
+
+        # The in-memory figures are vectorized into the PDF directly;
+        # no rasterize-to-PNG, re-read, and re-rasterize round trip.
+        # Document metadata and the title page are produced once per
+        # report; per-page fonts and styling come from the shared
+        # CHART_RC template, so nothing is re-configured between pages.
+        pdf_path = f"{self._out}dashboard_report.pdf"
+        with PdfPages(
+            pdf_path,
+            metadata={
+                "Title": "Market Share Analysis Dashboard Report",
+                "Subject": os.path.basename(self._source_path),
+            },
+        ) as pdf:
+            pdf.savefig(self._title_page())
+            for fig in figures.values():
+                pdf.savefig(fig)
+        return pdf_path, failed
+
+    def _title_page(self) -> Figure:
+        """Front page of the PDF report, built once per export."""
+        fig = Figure()
+        fig.text(0.5, 0.6, "Market Share Analysis Report",
+                 ha="center", fontsize=20, fontweight="bold")
+        fig.text(0.5, 0.5, f"Dataset: {os.path.basename(self._source_path)}",
+                 ha="center", fontsize=12)
+        fig.text(0.5, 0.44, f"Filters: Region={self._sel[0]}, Type={self._sel[1]}",
+                 ha="center", fontsize=12)
+        return fig
+
+    def _on_export_done(self, result):
+        pdf_path, failed = result
+        # PNGs that failed to write must not be treated as up to date.
+        self._png_clean -= set(failed)
+        if failed:
+            QMessageBox.warning(
+                self,
+                "Export Complete (with warnings)",
+                f"Report saved to {pdf_path}\n"
+                "These charts could not be exported as PNG:\n- "
+                + "\n- ".join(failed),
+            )
+        else:
+            QMessageBox.information(self, "Export Complete", f"Report saved to {pdf_path}")
+
+    def _on_export_error(self, message: str):
+        logger.error(f"Error exporting PDF: {message}")
+        self.show_error_message(f"Error exporting PDF: {message}")
+
     def show_error_message(self, message: str):
         """Show error message to user."""
-        from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.critical(self, "Error", message)
\ No newline at end of file
+        QMessageBox.critical(self, "Error", message)
@@ -6,62 +6,81 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QPalette, QColor
 
+# Stylesheets are immutable; building them once at import keeps every
+# widget construction from re-allocating the same literal and lets Qt
+# cache the parsed sheet against a single string identity.
+_BASE_STYLE = """
+    QMainWindow {
+        background-color: #f5f6fa;
+    }
+    QLabel {
+        color: #2c3e50;
+        font-size: 13px;
+    }
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        padding: 8px 15px;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+    QComboBox {
+        padding: 5px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        background: white;
+    }
+    QLineEdit {
+        padding: 5px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+    }
+    QGroupBox {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 8px;
+        margin-top: 1em;
+        padding: 15px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        background: white;
+    }
+    QTabBar::tab {
+        padding: 8px 15px;
+        margin-right: 2px;
+    }
+"""
+
 class ModernUI:
     """Base class for modern UI styling and common components."""
 
     @staticmethod
     def get_base_style() -> str:
-        return """
-            QMainWindow {
-                background-color: #f5f6fa;
-            }
-            QLabel {
-                color: #2c3e50;
-                font-size: 13px;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                padding: 8px 15px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background: white;
-            }
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-            QGroupBox {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                margin-top: 1em;
-                padding: 15px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background: white;
-            }
-            QTabBar::tab {
-                padding: 8px 15px;
-                margin-right: 2px;
-            }
-        """
+        return _BASE_STYLE
 
 class ModernFrame(QFrame):
     """Modern styled frame for grouping components."""
 
+    _STYLE = """
+        ModernFrame {
+            background-color: white;
+            border: 1px solid #ddd;
+            border-radius: 8px;
+            padding: 15px;
+        }
+    """
+    _TITLE_STYLE = """
+        font-weight: bold;
+        font-size: 14px;
+        color: #2c3e50;
+    """
+
     def __init__(self, title: str = "", parent=None):
         super().__init__(parent)
         self.title = title
@@ -69,44 +88,35 @@ class ModernFrame(QFrame):
 
     def init_ui(self):
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
-        self.setStyleSheet("""
-            ModernFrame {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        self.setStyleSheet(self._STYLE)
 
         layout = QVBoxLayout(self)
 
         if self.title:
             title_label = QLabel(self.title)
-            title_label.setStyleSheet("""
-                font-weight: bold;
-                font-size: 14px;
-                color: #2c3e50;
-            """)
+            title_label.setStyleSheet(self._TITLE_STYLE)
             layout.addWidget(title_label)
 
 class ModernButton(QPushButton):
     """Modern styled button with hover effects."""
 
+    _STYLE = """
+        ModernButton {
+            background-color: #3498db;
+            color: white;
+            padding: 8px 15px;
+            border: none;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        ModernButton:hover {
+            background-color: #2980b9;
+        }
+    """
+
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
         self.init_ui()
 
     def init_ui(self):
-        self.setStyleSheet("""
-            ModernButton {
-                background-color: #3498db;
-                color: white;
-                padding: 8px 15px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            ModernButton:hover {
-                background-color: #2980b9;
-            }
-        """)
\ No newline at end of file
+        self.setStyleSheet(self._STYLE)
@@ -1,4 +1,6 @@
 # settings_dialog.py
+import re
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QLabel, QLineEdit, QPushButton, QFormLayout, QSpinBox,
@@ -7,6 +9,10 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from typing import Dict, List
 
+# Tokenizer for comma-separated list fields, compiled once at import so
+# every save reuses the same pattern instead of recompiling it.
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
 class AnalyzerSettingsGroup(QGroupBox):
     """Group box for analyzer-specific settings."""
     def __init__(self, analyzer_type: str, config: Dict, parent=None):
@@ -15,17 +21,33 @@ class AnalyzerSettingsGroup(QGroupBox):
         self.config = config
         self.init_ui()
 
+    MAX_BRANDS = 8
+
     def init_ui(self):
         layout = QFormLayout()
+        self.form_layout = layout
 
-        # Brand columns
+        # Brand rows sit at form positions 0..n-1, mirrored by the
+        # brand_inputs list, so removing one is a constant-time
+        # QFormLayout.removeRow(int) on the tracked index rather than a
+        # scan over the layout's widgets.
         self.brand_inputs = []
-        for i in range(4):  # Maximum 4 brands
-            line_edit = QLineEdit()
-            if i < len(self.config["brand_columns"]):
-                line_edit.setText(self.config["brand_columns"][i])
-            self.brand_inputs.append(line_edit)
-            layout.addRow(f"Brand {i+1}:", line_edit)
+        for brand in self.config["brand_columns"] or [""]:
+            self._add_brand_row(brand)
+
+        row_buttons = QHBoxLayout()
+        add_button = QPushButton("Add Brand")
+        add_button.clicked.connect(self.add_brand_row)
+        remove_button = QPushButton("Remove Brand")
+        remove_button.clicked.connect(self.remove_brand_row)
+        row_buttons.addWidget(add_button)
+        row_buttons.addWidget(remove_button)
+        layout.addRow(row_buttons)
+
+        # Workload columns, entered as one comma-separated list
+        self.workload_edit = QLineEdit()
+        self.workload_edit.setText(", ".join(self.config.get("workload_columns", [])))
+        layout.addRow("Workload Columns:", self.workload_edit)
 
         # Test price
         self.price_spin = QDoubleSpinBox()
@@ -35,10 +57,33 @@ class AnalyzerSettingsGroup(QGroupBox):
 
         self.setLayout(layout)
 
+    def _add_brand_row(self, brand: str = ""):
+        line_edit = QLineEdit()
+        line_edit.setText(brand)
+        self.form_layout.insertRow(
+            len(self.brand_inputs), f"Brand {len(self.brand_inputs) + 1}:", line_edit
+        )
+        self.brand_inputs.append(line_edit)
+
+    def add_brand_row(self):
+        if len(self.brand_inputs) < self.MAX_BRANDS:
+            self._add_brand_row()
+
+    def remove_brand_row(self):
+        if len(self.brand_inputs) <= 1:
+            return
+        # The last brand row's form index is just the list length.
+        self.form_layout.removeRow(len(self.brand_inputs) - 1)
+        self.brand_inputs.pop()
+
     def get_settings(self) -> Dict:
         """Get current settings from the group."""
+        # Read each widget once; .text() crosses into Qt per call.
+        brands = [text for edit in self.brand_inputs if (text := edit.text())]
+        workloads = [t for t in _CSV_SPLIT.split(self.workload_edit.text().strip()) if t]
         return {
-            "brand_columns": [edit.text() for edit in self.brand_inputs if edit.text()],
+            "brand_columns": brands,
+            "workload_columns": workloads,
             "test_price": self.price_spin.value()
         }
 
@@ -0,0 +1,23 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+# The GUI tests must run without a display; the offscreen platform has
+# to be selected before the first QApplication is created.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication per test process.
+
+    Qt allows a single QApplication per process; under pytest-xdist
+    each worker is its own process, so every worker builds (or reuses)
+    exactly one instance and GUI tests can fan out across CPUs.
+    """
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
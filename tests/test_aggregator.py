@@ -0,0 +1,197 @@
+# tests/test_aggregator.py
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aggregator import WorkingAggregator
+
+BRAND_COLS = ["Brand 1", "Brand 2", "Brand 3"]
+WORKLOAD_COLS = ["Workload 1", "Workload 2", "Workload 3"]
+DAYS_PER_YEAR = 350
+
+# Shared read-only fixtures, built once at import; no test mutates
+# them, so there is nothing to re-create per test. Brands and workloads
+# live in two plain ndarrays (SoA) instead of one mixed-dtype DataFrame,
+# so row slices are cheap array views rather than boxed object Series.
+# The workload matrix is F-ordered so per-column slices stay contiguous.
+BRAND_ARR = np.array(
+    [
+        ["BrandA", "BrandB", None],
+        ["BrandB", "BrandC", "BrandA"],
+        ["BrandA", "BrandA", "BrandC"],
+    ],
+    dtype=object,
+)
+WORKLOAD_ARR = np.array(
+    [
+        [10, 15, np.nan],
+        [20, 25, 5],
+        [30, 35, 15],
+    ],
+    dtype=np.float64,
+    order="F",
+)
+CITIES = ["City1", "City1", "City2"]
+
+# Expected pivot output as a plain matrix; the pivot test compares
+# numerics with one vectorized allclose instead of pandas' full
+# structural frame equality.
+EXPECTED_CITY_COLS = ["BRANDA", "BRANDB", "BRANDC"]
+EXPECTED_CITY_MATRIX = np.array(
+    [
+        [5250.0, 12250.0, 8750.0],
+        [22750.0, 0.0, 5250.0],
+    ]
+)
+
+
+def _make_large_frame(n_rows: int) -> pd.DataFrame:
+    """Synthetic frame built from whole arrays, no per-row insertion."""
+    rng = np.random.default_rng(42)
+    data = {}
+    for col in BRAND_COLS:
+        data[col] = rng.choice(
+            np.array(["BrandA", "BrandB", "BrandC", None], dtype=object), n_rows
+        )
+    for col in WORKLOAD_COLS:
+        data[col] = rng.uniform(0, 100, n_rows)
+    return pd.DataFrame(data)
+
+
+def _row(i: int) -> pd.Series:
+    """One input row as the Series allocate_row_brands expects."""
+    values = dict(zip(BRAND_COLS, BRAND_ARR[i]))
+    values.update(zip(WORKLOAD_COLS, WORKLOAD_ARR[i]))
+    return pd.Series(values)
+
+
+@pytest.fixture(scope="module")
+def sample_data() -> pd.DataFrame:
+    data = {
+        "Customer Name": ["Site1", "Site2", "Site3"],
+        "CITY": CITIES,
+        "Class": ["CLASS A", "CLASS B", "CLASS A"],
+        "Region": ["SOUTH", "NORTH", "SOUTH"],
+        "Type": ["PRIVATE", "GOVT", "PRIVATE"],
+    }
+    for j, col in enumerate(BRAND_COLS):
+        data[col] = BRAND_ARR[:, j]
+    for j, col in enumerate(WORKLOAD_COLS):
+        data[col] = WORKLOAD_ARR[:, j]
+    return pd.DataFrame(data)
+
+
+def test_standardize_brand():
+    assert WorkingAggregator.standardize_brand("  brandA ") == "BRANDA"
+    assert WorkingAggregator.standardize_brand("NILL") is None
+    assert WorkingAggregator.standardize_brand(np.nan) is None
+
+
+def test_clean_numeric():
+    assert WorkingAggregator.clean_numeric("5") == 5.0
+    assert WorkingAggregator.clean_numeric(None) == 0.0
+    assert WorkingAggregator.clean_numeric("garbage") == 0.0
+
+
+def test_validate_columns_success(sample_data):
+    assert WorkingAggregator.validate_columns(sample_data, ["CITY", "Region"])
+
+
+def test_validate_columns_missing(sample_data):
+    with pytest.raises(ValueError):
+        WorkingAggregator.validate_columns(sample_data, ["Missing Column"])
+
+
+def test_allocate_row_brands():
+    allocations = WorkingAggregator.allocate_row_brands(
+        _row(0), BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR
+    )
+    # Row 0: daily sum 25, yearly 8750, split 10/25 and 15/25.
+    assert dict(allocations) == {"BRANDA": 3500.0, "BRANDB": 5250.0}
+
+
+def test_allocate_row_brands_no_workload():
+    empty = pd.Series(
+        dict(zip(BRAND_COLS, ["BrandA", None, None]))
+        | dict(zip(WORKLOAD_COLS, [0.0, np.nan, np.nan]))
+    )
+    assert (
+        WorkingAggregator.allocate_row_brands(
+            empty, BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR
+        )
+        == []
+    )
+
+
+def test_calculate_market_share():
+    share = WorkingAggregator.calculate_market_share(
+        {"BRANDA": 300.0, "BRANDB": 100.0}
+    )
+    assert share == {"BRANDA": 75.0, "BRANDB": 25.0}
+
+
+def test_calculate_market_share_empty():
+    assert WorkingAggregator.calculate_market_share({}) == {}
+
+
+def test_calculate_brand_totals(sample_data):
+    totals = WorkingAggregator.calculate_brand_totals(
+        sample_data, BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR
+    )
+    assert set(totals) == {"BRANDA", "BRANDB", "BRANDC"}
+    assert totals["BRANDA"] == pytest.approx(28000.0)
+    assert totals["BRANDB"] == pytest.approx(12250.0)
+    assert totals["BRANDC"] == pytest.approx(14000.0)
+
+
+def test_create_pivot_table(sample_data):
+    pivot = WorkingAggregator.create_pivot_table(
+        sample_data, BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR, "CITY"
+    )
+    assert list(pivot["CITY"]) == ["City1", "City2"]
+    np.testing.assert_allclose(
+        pivot.reindex(columns=EXPECTED_CITY_COLS).to_numpy(dtype=np.float64),
+        EXPECTED_CITY_MATRIX,
+    )
+
+
+def test_calculate_brand_totals_matches_row_allocation():
+    # The vectorized totals must agree with summing the per-row
+    # allocation helper, including rows with nulls and zeros.
+    df = _make_large_frame(500)
+    expected = {}
+    for _, row in df.iterrows():
+        for brand, allocated in WorkingAggregator.allocate_row_brands(
+            row, BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR
+        ):
+            expected[brand] = expected.get(brand, 0.0) + allocated
+    totals = WorkingAggregator.calculate_brand_totals(
+        df, BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR
+    )
+    assert set(totals) == set(expected)
+    for brand, value in expected.items():
+        assert totals[brand] == pytest.approx(value, abs=1e-4)
+
+
+def test_calculate_brand_totals_large_frame():
+    # Regression guard for the vectorized path: the old per-row
+    # loop took tens of seconds at this size.
+    df = _make_large_frame(200_000)
+    start = time.perf_counter()
+    totals = WorkingAggregator.calculate_brand_totals(
+        df, BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR
+    )
+    elapsed = time.perf_counter() - start
+    assert set(totals) == {"BRANDA", "BRANDB", "BRANDC"}
+    assert elapsed < 2.0
+
+
+def test_create_pivot_table_missing_column(sample_data):
+    assert (
+        WorkingAggregator.create_pivot_table(
+            sample_data, BRAND_COLS, WORKLOAD_COLS, DAYS_PER_YEAR, "District"
+        )
+        is None
+    )
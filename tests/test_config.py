@@ -0,0 +1,90 @@
+# tests/test_config.py
+import copy
+import json
+import os
+
+import pytest
+
+from config import MarketAnalysisConfig
+
+
+@pytest.fixture(scope="module")
+def cfg(tmp_path_factory):
+    """One default-config manager shared by every test in this module.
+
+    The path does not exist, so the defaults stay untouched; tests that
+    mutate configuration deepcopy what they change instead of forcing a
+    rebuild of the full default tree per test.
+    """
+    return MarketAnalysisConfig(
+        config_path=str(tmp_path_factory.mktemp("cfg") / "config.json")
+    )
+
+
+@pytest.fixture(scope="module")
+def default_config_json(cfg):
+    # Serialized once per module instead of per test: every comparison
+    # against the saved form reuses the same string.
+    return json.dumps(cfg.config_data, indent=2)
+
+
+@pytest.mark.parametrize(
+    "getter,expected",
+    [
+        (lambda c: c.get_analyzer_config("IA")["name"], "Immunoassay"),
+        (lambda c: c.get_analyzer_config("IA")["test_price"], 250.0),
+        (lambda c: c.get_analyzer_config("CBC")["name"], "Hematology"),
+        (lambda c: c.get_analyzer_config("CHEM")["test_price"], 100.0),
+        (lambda c: c.get_analyzer_config("UNKNOWN"), {}),
+        (lambda c: c.get_analysis_settings()["days_per_year"], 330),
+        (lambda c: c.get_analysis_settings()["value_analysis"], True),
+    ],
+)
+def test_getters(cfg, getter, expected):
+    assert getter(cfg) == expected
+
+
+def test_default_analyzers_present(cfg):
+    assert set(cfg.config_data["analyzers"]) == {"IA", "CBC", "CHEM"}
+
+
+def test_metadata_lists(cfg):
+    metadata = cfg.config_data["metadata"]
+    assert "SOUTH" in metadata["regions"]
+    assert "PRIVATE" in metadata["types"]
+
+
+def test_injected_loader_overrides_defaults():
+    # Injection keeps loading in memory: no file, no JSON codec.
+    config = MarketAnalysisConfig(
+        config_path="ignored.json",
+        loader=lambda path: {"analysis_settings": {"days_per_year": 300}},
+    )
+    assert config.get_analysis_settings()["days_per_year"] == 300
+
+
+def test_injected_saver_receives_config():
+    saved = {}
+    config = MarketAnalysisConfig(
+        config_path="target.json",
+        loader=lambda path: None,
+        saver=lambda path, data: saved.update({path: data}),
+    )
+    config.save_config()
+    assert "target.json" in saved
+    assert saved["target.json"] is config.config_data
+
+
+def test_save_config_writes_default_json(tmp_path, default_config_json):
+    path = os.path.join(tmp_path, "config.json")
+    config = MarketAnalysisConfig(config_path=path)
+    config.save_config()
+    with open(path) as f:
+        assert f.read() == default_config_json
+
+
+def test_mutated_copy_leaves_shared_config_intact(cfg):
+    mutated = copy.deepcopy(cfg.config_data)
+    mutated["analyzers"]["IA"]["workload_columns"] = []
+    assert mutated["analyzers"]["IA"]["workload_columns"] == []
+    assert len(cfg.config_data["analyzers"]["IA"]["workload_columns"]) == 3
@@ -0,0 +1,132 @@
+# tests/test_main.py
+import types
+
+import pandas as pd
+import pytest
+
+# One fake AnalysisResult shared by every test that stubs the pipeline.
+# SimpleNamespace gives plain attribute access (no mock proxy, no call
+# recording) and the empty pivot frames are built exactly once.
+_EMPTY_PIVOT = pd.DataFrame()
+FAKE_RESULT = types.SimpleNamespace(
+    brand_totals={"BRANDA": 140.0, "BRANDB": 210.0},
+    market_share={"BRANDA": 40.0, "BRANDB": 60.0},
+    brand_values={"BRANDA": 35000.0, "BRANDB": 52500.0},
+    city_pivot=_EMPTY_PIVOT,
+    class_pivot=_EMPTY_PIVOT,
+    summary_stats={"total_sites": 3},
+)
+
+
+def test_process_data_pipeline_single_analyzer(tmp_path):
+    # The pipeline is Qt-free, so no QApplication (or window) is needed.
+    from config import MarketAnalysisConfig
+    from main import ProcessCtx, process_data_pipeline
+
+    df = pd.DataFrame({
+        "Customer Name": ["Lab1", "Lab2", "Lab3"],
+        "CITY": ["City1", "City1", "City2"],
+        "Class": ["CLASS A", "CLASS B", "CLASS A"],
+        "Region": ["SOUTH", "SOUTH", "NORTH"],
+        "Type": ["PRIVATE", "GOVT", "PRIVATE"],
+        "IA Brand 1": ["BrandA", "BrandB", "BrandA"],
+        "IA Brand 2": ["BrandB", None, None],
+        "IA Brand 3": [None, None, None],
+        "IA Workload - Brand 1": [10.0, 20.0, 30.0],
+        "IA Workload - Brand 2": [15.0, None, None],
+        "IA Workload - Brand 3": [None, None, None],
+    })
+    input_path = tmp_path / "input.xlsx"
+    df.to_excel(input_path, sheet_name="Sheet1", index=False)
+
+    config = MarketAnalysisConfig(config_path=str(tmp_path / "missing.json"))
+    ctx = ProcessCtx(
+        input_path=str(input_path),
+        output_path=str(tmp_path / "out.xlsx"),
+        sheet="Sheet1",
+        analyzer="IA",
+        region="SOUTH",
+    )
+    results = process_data_pipeline(ctx, config.config_data)
+
+    assert set(results) == {"IA"}
+    shares = results["IA"].market_share
+    assert set(shares) == {"BRANDA", "BRANDB"}
+    assert sum(shares.values()) == pytest.approx(100.0)
+
+
+@pytest.fixture
+def window(qapp):
+    """A main window instance backed by the session QApplication."""
+    from main import ModernMarketAnalyzer
+
+    w = ModernMarketAnalyzer()
+    yield w
+    w.close()
+
+
+def test_initial_ui_elements(window):
+    assert window.windowTitle() == "Market Share Analysis Tool"
+    analyzers = [window.analyzer_combo.itemText(i)
+                 for i in range(window.analyzer_combo.count())]
+    assert analyzers == ["IA", "CBC", "CHEM", "Consolidated"]
+    assert window.region_combo.itemText(0) == "All"
+    assert window.input_edit.text() == ""
+    assert window.output_edit.text() == ""
+
+
+def test_validate_inputs_requires_paths(window, monkeypatch):
+    import main as main_module
+
+    warnings = []
+    monkeypatch.setattr(
+        main_module.QMessageBox, "warning",
+        staticmethod(lambda *args, **kwargs: warnings.append(args)),
+    )
+    assert window.validate_inputs() is False
+
+    window.input_edit.setText("input.xlsx")
+    window.output_edit.setText("output.xlsx")
+    window.sheet_combo.addItem("Sheet1")
+    assert window.validate_inputs() is True
+    assert len(warnings) == 1
+
+
+def test_process_data_dispatches_pipeline_results(window, monkeypatch):
+    import main as main_module
+
+    window.input_edit.setText("input.xlsx")
+    window.output_edit.setText("output.xlsx")
+    window.sheet_combo.addItem("Sheet1")
+
+    monkeypatch.setattr(
+        main_module, "process_data_pipeline", lambda ctx, config: {"IA": FAKE_RESULT}
+    )
+    seen = []
+    for hook in ("update_results_display", "save_results", "update_visualizations"):
+        monkeypatch.setattr(
+            window, hook,
+            lambda result, analyzer, hook=hook: seen.append((hook, analyzer)),
+        )
+
+    window.process_data()
+
+    assert window.latest_results is FAKE_RESULT
+    assert seen == [
+        ("update_results_display", "IA"),
+        ("save_results", "IA"),
+        ("update_visualizations", "IA"),
+    ]
+
+
+def test_apply_filters_region(window):
+    df = pd.DataFrame({
+        "Region": ["SOUTH", "NORTH", "SOUTH"],
+        "Value": [1, 2, 3],
+    })
+    window.region_combo.setCurrentText("SOUTH")
+    filtered = window.apply_filters(df)
+    assert list(filtered["Value"]) == [1, 3]
+
+    window.region_combo.setCurrentText("All")
+    assert len(window.apply_filters(df)) == 3
@@ -2,18 +2,200 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 
+_STYLE_INITIALIZED = False
+
+# Rendered canvases kept per visualizer for identical re-requests.
+_CANVAS_CACHE_MAX = 32
+
+# Cleared Figures kept around for reuse instead of reallocation.
+_FIG_POOL_MAX = 8
+
+
+def _init_style():
+    """Apply the process-global chart style at most once.
+
+    plt.style.use rebuilds the whole rcParams dict, so repeat visualizer
+    instances should not pay for (or re-trigger) it.
+    """
+    global _STYLE_INITIALIZED
+    if _STYLE_INITIALIZED:
+        return
+    try:
+        plt.style.use('seaborn-v0_8')
+    except OSError:
+        # matplotlib < 3.6 ships the style under its old plain name.
+        plt.style.use('seaborn')
+    sns.set_palette("husl")
+    _STYLE_INITIALIZED = True
+
+
+class _DashboardSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class _DashboardWorker(QRunnable):
+    """Runs one figure-building task on the global thread pool."""
+
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+        self.signals = _DashboardSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(self.task())
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
 class MarketShareVisualizer:
     """Handles all visualization components for market share analysis."""
 
     def __init__(self):
         # Set style for consistent look
-        plt.style.use('seaborn')
-        sns.set_palette("husl")
+        _init_style()
         self.colors = sns.color_palette("husl", 8)
+        # Palette as an array so cache misses in _assign_colors cycle it
+        # with one vectorized modular index instead of per-item %.
+        self._palette_arr = np.asarray(self.colors)
+        self._palette_len = len(self.colors)
+        self._color_cache: Dict[tuple, tuple] = {}
+        self._canvas_cache: Dict[tuple, FigureCanvasQTAgg] = {}
+        # Live dashboard state: one figure reused across updates, with
+        # per-panel input hashes so unchanged panels skip their redraw.
+        self._dashboard_canvas: Optional[FigureCanvasQTAgg] = None
+        self._dashboard_axes: Optional[list] = None
+        self._dashboard_hashes: list = [None] * 4
+        self._explode_cache: Dict[int, np.ndarray] = {}
+        self._fig_pool: list = []
+        self._cat_cache: Dict[tuple, pd.DataFrame] = {}
+
+    def _categorize(self, df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+        """Return df with the given key columns cast to category.
+
+        Integer-coded keys keep groupby on the Cython fast path instead
+        of hashing object strings per row. Cached per frame identity and
+        column set so repeat renders of one frame pay for the cast once.
+        Each entry keeps a reference to its source frame: that pins the
+        id for the entry's lifetime, so a new frame can never recycle a
+        cached frame's address and get a stale hit.
+        """
+        need = [
+            c for c in cols
+            if c in df.columns and not isinstance(df[c].dtype, pd.CategoricalDtype)
+        ]
+        if not need:
+            return df
+        key = (id(df), tuple(need))
+        entry = self._cat_cache.get(key)
+        if entry is not None and entry[0] is df:
+            return entry[1]
+        if len(self._cat_cache) >= _CANVAS_CACHE_MAX:
+            self._cat_cache.clear()
+        converted = df.assign(**{c: df[c].astype('category') for c in need})
+        self._cat_cache[key] = (df, converted)
+        return converted
+
+    def _acquire_fig(self, figsize: tuple) -> Figure:
+        """Hand out a Figure of the given size, pooled when possible.
+
+        Figure/Axes construction is surprisingly heavy (rcParams
+        resolution per artist); steady-state refreshes reuse cleared
+        figures instead of allocating new ones.
+        """
+        want = tuple(map(float, figsize))
+        for i, fig in enumerate(self._fig_pool):
+            if tuple(fig.get_size_inches()) == want:
+                return self._fig_pool.pop(i)
+        return Figure(figsize=figsize, layout='constrained')
+
+    def _release_fig(self, fig: Figure):
+        """Clear a retired figure and keep it for reuse, capped."""
+        if len(self._fig_pool) < _FIG_POOL_MAX:
+            fig.clf()
+            self._fig_pool.append(fig)
+
+    @staticmethod
+    def _hash_inputs(data) -> int:
+        """Cheap content hash of chart input data.
+
+        Frames hash through pandas' vectorized row hasher; share dicts
+        hash their sorted items.
+        """
+        if isinstance(data, pd.DataFrame):
+            row_hashes = pd.util.hash_pandas_object(data, index=True)
+            return hash((data.shape, row_hashes.to_numpy().tobytes()))
+        return hash(tuple(sorted(data.items())))
+
+    def _cached_canvas(self, key: tuple, build) -> FigureCanvasQTAgg:
+        """Return the memoized canvas for key, building it on a miss.
+
+        Tab switches and refreshes routinely re-request a chart with
+        identical inputs; those hits skip the whole figure build. The
+        cache is LRU-capped so stale renders age out.
+        """
+        canvas = self._canvas_cache.pop(key, None)
+        if canvas is None:
+            canvas = build()
+            if len(self._canvas_cache) >= _CANVAS_CACHE_MAX:
+                # Evict only; handed-out canvases may still sit in a
+                # caller's layout, so their figures must not be cleared
+                # and re-pooled here. _release_fig is for callers that
+                # know their canvas is gone.
+                self._canvas_cache.pop(next(iter(self._canvas_cache)))
+        self._canvas_cache[key] = canvas
+        return canvas
+
+    def _assign_colors(self, categories) -> tuple:
+        """Map categories to palette colors, memoized per category set.
+
+        Repeat renders of the same brands/regions hit an O(1) lookup and
+        get back the physically same tuple instead of re-indexing the
+        palette for every chart.
+        """
+        key = tuple(categories)
+        colors = self._color_cache.get(key)
+        if colors is None:
+            cycled = self._palette_arr[np.arange(len(key)) % self._palette_len]
+            colors = tuple(map(tuple, cycled))
+            self._color_cache[key] = colors
+        return colors
+
+    def _explode(self, n: int) -> np.ndarray:
+        """Explode offsets for an n-slice pie, built once per size.
+
+        The largest (first) slice gets the 0.05 offset; repeat pie
+        renders of the same slice count reuse one array instead of
+        rebuilding a Python list.
+        """
+        explode = self._explode_cache.get(n)
+        if explode is None:
+            explode = np.zeros(n)
+            if n:
+                explode[0] = 0.05
+            self._explode_cache[n] = explode
+        return explode
+
+    @staticmethod
+    def _sorted_pair(data: Dict[str, float]):
+        """Split a mapping into labels and values, sorted descending.
+
+        One C-level argsort replaces the dict(sorted(...)) rebuild plus
+        the extra passes to pull labels and sizes back out.
+        """
+        keys = np.fromiter(data.keys(), dtype=object, count=len(data))
+        vals = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+        order = np.argsort(vals)[::-1]
+        return keys[order].tolist(), vals[order]
 
     def create_market_share_chart(
         self,
@@ -21,25 +203,44 @@ class MarketShareVisualizer:
         title: str = "Market Share Distribution"
     ) -> FigureCanvasQTAgg:
         """Create pie chart for market share visualization."""
-        fig, ax = plt.subplots(figsize=(10, 8))
+        def build():
+            fig = self._acquire_fig((10, 8))
+            ax = fig.add_subplot(111)
 
-        # Sort data by value for better visualization
-        sorted_data = dict(sorted(data.items(), key=lambda x: x[1], reverse=True))
+            # Sort data by value for better visualization
+            labels, sizes = self._sorted_pair(data)
 
-        wedges, texts, autotexts = ax.pie(
-            sorted_data.values(),
-            labels=sorted_data.keys(),
-            autopct='%1.1f%%',
-            colors=self.colors,
-            explode=[0.05 if i == 0 else 0 for i in range(len(sorted_data))]
-        )
+            wedges, texts, autotexts = ax.pie(
+                sizes,
+                labels=labels,
+                autopct='%1.1f%%',
+                colors=self._assign_colors(labels),
+                explode=self._explode(len(labels))
+            )
 
-        # Style enhancements
-        plt.setp(autotexts, size=9, weight="bold")
-        plt.setp(texts, size=10)
-        ax.set_title(title, pad=20, size=14)
+            # Style enhancements; direct set_* calls skip setp's
+            # per-artist property dispatch
+            for t in autotexts:
+                t.set_fontsize(9)
+                t.set_fontweight("bold")
+            for t in texts:
+                t.set_fontsize(10)
+            ax.set_title(title, pad=20, size=14)
 
-        return FigureCanvasQTAgg(fig)
+            return FigureCanvasQTAgg(fig)
+
+        return self._cached_canvas(('pie', title, self._hash_inputs(data)), build)
+
+    def _create_pie_subplot(self, ax, data: Dict[str, float], title: str):
+        """Market-share pie panel for the summary dashboard."""
+        labels, sizes = self._sorted_pair(data)
+        ax.pie(
+            sizes,
+            labels=labels,
+            autopct='%1.1f%%',
+            colors=self._assign_colors(labels),
+        )
+        ax.set_title(title, size=12)
 
     def create_regional_analysis_chart(
         self,
@@ -49,29 +250,95 @@ class MarketShareVisualizer:
         title: str = "Regional Distribution"
     ) -> FigureCanvasQTAgg:
         """Create bar chart for regional analysis."""
-        fig, ax = plt.subplots(figsize=(12, 6))
+        def build():
+            fig = self._acquire_fig((12, 6))
+            ax = fig.add_subplot(111)
+            if len(df.index) == 0:
+                ax.set_title(title, pad=20, size=14)
+                return FigureCanvasQTAgg(fig)
 
-        # Create bar plot with seaborn
-        sns.barplot(
-            data=df,
-            x=region_col,
-            y=value_col,
-            ax=ax,
-            palette=self.colors
-        )
+            # Aggregate straight to a Series and feed it as-is; the
+            # reset_index rebuild just to name barplot columns is skipped.
+            work = self._categorize(df, [region_col])
+            agg = work.groupby(region_col, sort=False, observed=True)[value_col].sum()
+
+            # Pre-aggregated bars go straight to matplotlib; seaborn's
+            # barplot would re-group and set up estimator machinery for
+            # data that already has one value per region.
+            ax.bar(
+                agg.index.astype(str).tolist(),
+                agg.to_numpy(dtype=np.float64),
+                color=self._assign_colors(agg.index)
+            )
+
+            # Enhance styling
+            ax.set_title(title, pad=20, size=14)
+            ax.set_xlabel(region_col, size=12)
+            ax.set_ylabel("Market Share (%)", size=12)
+            ax.tick_params(axis='x', rotation=45)
+
+            # Add value labels on bars, one vectorized call per container
+            for container in ax.containers:
+                ax.bar_label(container, fmt='%.1f%%', label_type='edge', padding=2)
+
+            return FigureCanvasQTAgg(fig)
+
+        key = ('regional', region_col, value_col, title, self._hash_inputs(df))
+        return self._cached_canvas(key, build)
+
+    def _create_regional_subplot(self, ax, df: pd.DataFrame):
+        """Regional bar panel for the summary dashboard."""
+        if len(df.index) == 0:
+            ax.set_title("Regional Distribution", size=12)
+            return
+        regions = df['Region'].astype(str)
+        bars = ax.bar(regions, df['Share'], color=self._assign_colors(regions))
+        ax.bar_label(bars, fmt='%.1f', label_type='edge', padding=2)
+        ax.set_title("Regional Distribution", size=12)
+        ax.set_ylabel("Market Share (%)")
+        ax.tick_params(axis='x', rotation=45)
+
+    def _plot_trends(self, ax, df: pd.DataFrame, time_col: str, brands: List[str]):
+        """Draw per-brand share lines as one LineCollection.
 
-        # Enhance styling
-        ax.set_title(title, pad=20, size=14)
-        ax.set_xlabel(region_col, size=12)
-        ax.set_ylabel("Market Share (%)", size=12)
-        plt.xticks(rotation=45)
+        One filter-and-sort pass replaces the per-brand boolean scans,
+        and all lines go into a single collection artist instead of one
+        Line2D per brand; the legend uses proxy handles.
+        """
+        df = self._categorize(df, ['Brand'])
+        mask = df['Brand'].isin(brands)
+        sub = (df if mask.all() else df[mask]).sort_values(time_col, kind='stable')
+        if len(sub.index) == 0:
+            return
 
-        # Add value labels on bars
-        for i, v in enumerate(df[value_col]):
-            ax.text(i, v, f'{v:.1f}%', ha='center', va='bottom')
+        x_vals = sub[time_col]
+        if not pd.api.types.is_numeric_dtype(x_vals):
+            # LineCollection needs numeric coordinates; map the sorted
+            # periods onto integer positions and label the ticks.
+            periods = pd.unique(x_vals)
+            ax.set_xticks(range(len(periods)))
+            ax.set_xticklabels(periods)
+            x_vals = x_vals.map({p: i for i, p in enumerate(periods)})
+        x = x_vals.to_numpy(dtype=np.float64)
+        y = sub['Share'].to_numpy(dtype=np.float64)
 
-        plt.tight_layout()
-        return FigureCanvasQTAgg(fig)
+        groups = sub.groupby('Brand', sort=False, observed=True).indices
+        colors = self._assign_colors(groups)
+        segments = [np.column_stack((x[idx], y[idx])) for idx in groups.values()]
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=2))
+        # Marker colors must follow sub's row order, not group-block
+        # order: brands interleave over time, so map brand -> color per
+        # row instead of repeating each group's color contiguously.
+        brand_color = dict(zip(groups, colors))
+        ax.scatter(x, y, s=18, c=[brand_color[b] for b in sub['Brand']])
+        ax.autoscale_view()
+        ax.legend(
+            handles=[
+                Line2D([], [], color=c, marker='o', linewidth=2, label=b)
+                for b, c in zip(groups, colors)
+            ],
+            title="Brands",
+        )
 
     def create_trend_chart(
         self,
@@ -81,27 +348,41 @@ class MarketShareVisualizer:
         title: str = "Market Share Trends"
     ) -> FigureCanvasQTAgg:
         """Create line chart for trend analysis."""
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        for idx, brand in enumerate(brands):
-            brand_data = df[df['Brand'] == brand]
-            ax.plot(
-                brand_data[time_col],
-                brand_data['Share'],
-                marker='o',
-                linewidth=2,
-                label=brand,
-                color=self.colors[idx]
-            )
+        def build():
+            fig = self._acquire_fig((12, 6))
+            ax = fig.add_subplot(111)
+
+            self._plot_trends(ax, df, time_col, brands)
+
+            ax.set_title(title, pad=20, size=14)
+            ax.set_xlabel("Time Period", size=12)
+            ax.set_ylabel("Market Share (%)", size=12)
+            ax.grid(True, linestyle='--', alpha=0.7)
+
+            return FigureCanvasQTAgg(fig)
+
+        key = ('trend', time_col, tuple(brands), title, self._hash_inputs(df))
+        return self._cached_canvas(key, build)
 
-        ax.set_title(title, pad=20, size=14)
-        ax.set_xlabel("Time Period", size=12)
-        ax.set_ylabel("Market Share (%)", size=12)
-        ax.legend(title="Brands", title_fontsize=12)
+    def _create_trend_subplot(self, ax, df: pd.DataFrame, time_col: str = 'Period'):
+        """Trend panel for the summary dashboard."""
+        self._plot_trends(ax, df, time_col, list(pd.unique(df['Brand'])))
+        ax.set_title("Market Share Trends", size=12)
+        ax.set_ylabel("Market Share (%)")
         ax.grid(True, linestyle='--', alpha=0.7)
 
-        plt.tight_layout()
-        return FigureCanvasQTAgg(fig)
+    def _class_share_pivot(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Class x Brand share matrix via one Cython groupby kernel.
+
+        Equivalent to pivot_table(aggfunc='sum').fillna(0) without the
+        generic pivot_table dispatch or the separate fillna pass.
+        """
+        work = self._categorize(df, ['Class', 'Brand'])
+        return (
+            work.groupby(['Class', 'Brand'], sort=False, observed=True)['Share']
+            .sum()
+            .unstack(fill_value=0)
+        )
 
     def create_class_distribution_chart(
         self,
@@ -109,39 +390,75 @@ class MarketShareVisualizer:
         title: str = "Class Distribution Analysis"
     ) -> FigureCanvasQTAgg:
         """Create stacked bar chart for class distribution."""
-        fig, ax = plt.subplots(figsize=(12, 6))
+        def build():
+            fig = self._acquire_fig((12, 6))
+            ax = fig.add_subplot(111)
+
+            df_pivot = self._class_share_pivot(df)
+            if df_pivot.size == 0:
+                ax.set_title(title, pad=20, size=14)
+                return FigureCanvasQTAgg(fig)
+
+            df_pivot.plot(
+                kind='bar',
+                stacked=True,
+                ax=ax,
+                color=self._assign_colors(df_pivot.columns)
+            )
+
+            # Segment labels, formatted in one vectorized pass per
+            # brand; sub-1% slivers get empty strings so no Text artist
+            # is allocated for them.
+            for container, col in zip(ax.containers, df_pivot.columns):
+                vals = df_pivot[col].to_numpy(dtype=np.float64)
+                labels = np.where(
+                    vals >= 1.0,
+                    np.char.add(np.round(vals, 1).astype(str), '%'),
+                    ''
+                )
+                ax.bar_label(
+                    container, labels=labels.tolist(),
+                    label_type='center', fontsize=8
+                )
 
-        df_pivot = df.pivot_table(
-            index='Class',
-            columns='Brand',
-            values='Share',
-            aggfunc='sum'
-        ).fillna(0)
+            ax.set_title(title, pad=20, size=14)
+            ax.set_xlabel("Class", size=12)
+            ax.set_ylabel("Market Share (%)", size=12)
+            ax.legend(title="Brands", bbox_to_anchor=(1.05, 1))
 
+            return FigureCanvasQTAgg(fig)
+
+        return self._cached_canvas(('class', title, self._hash_inputs(df)), build)
+
+    def _create_class_subplot(self, ax, df: pd.DataFrame):
+        """Class distribution panel for the summary dashboard."""
+        df_pivot = self._class_share_pivot(df)
+        if df_pivot.size == 0:
+            ax.set_title("Class Distribution", size=12)
+            return
         df_pivot.plot(
             kind='bar',
             stacked=True,
             ax=ax,
-            color=self.colors
+            color=self._assign_colors(df_pivot.columns),
+            legend=False,
         )
+        ax.set_title("Class Distribution", size=12)
+        ax.set_ylabel("Market Share (%)")
 
-        ax.set_title(title, pad=20, size=14)
-        ax.set_xlabel("Class", size=12)
-        ax.set_ylabel("Market Share (%)", size=12)
-        ax.legend(title="Brands", bbox_to_anchor=(1.05, 1))
-
-        plt.tight_layout()
-        return FigureCanvasQTAgg(fig)
-
-    def create_summary_dashboard(
+    def _build_dashboard_figure(
         self,
         market_share: Dict[str, float],
         regional_data: pd.DataFrame,
         trend_data: pd.DataFrame,
         class_data: pd.DataFrame
-    ) -> FigureCanvasQTAgg:
-        """Create a comprehensive dashboard with multiple charts."""
-        fig = plt.figure(figsize=(20, 12))
+    ) -> Figure:
+        """Assemble the four-panel dashboard Figure.
+
+        Built on a bare Figure (no pyplot state), so it is safe to run
+        off the GUI thread and to wrap in any canvas afterwards.
+        """
+        fig = Figure(figsize=(20, 12), layout='constrained')
 
         # Market Share Pie Chart
         ax1 = fig.add_subplot(221)
@@ -159,5 +476,89 @@ class MarketShareVisualizer:
         ax4 = fig.add_subplot(224)
         self._create_class_subplot(ax4, class_data)
 
-        plt.tight_layout()
-        return FigureCanvasQTAgg(fig)
\ No newline at end of file
+        return fig
+
+    def export_dashboard(
+        self,
+        path: str,
+        market_share: Dict[str, float],
+        regional_data: pd.DataFrame,
+        trend_data: pd.DataFrame,
+        class_data: pd.DataFrame,
+        dpi: int = 100
+    ):
+        """Write the summary dashboard straight to an image file.
+
+        The figure never gets a Qt canvas: Agg renders it headlessly, so
+        exports work without widget allocation (or a display at all).
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        fig = self._build_dashboard_figure(
+            market_share, regional_data, trend_data, class_data
+        )
+        FigureCanvasAgg(fig)
+        fig.savefig(path, dpi=dpi, bbox_inches='tight')
+
+    def create_summary_dashboard(
+        self,
+        market_share: Dict[str, float],
+        regional_data: pd.DataFrame,
+        trend_data: pd.DataFrame,
+        class_data: pd.DataFrame
+    ) -> FigureCanvasQTAgg:
+        """Create a comprehensive dashboard with multiple charts.
+
+        The figure, axes and canvas are built once and reused; each call
+        redraws only the panels whose input hash changed and schedules a
+        single draw_idle instead of rebuilding four subplots.
+        """
+        panels = (
+            (market_share,
+             lambda ax, d: self._create_pie_subplot(ax, d, "Market Share Distribution")),
+            (regional_data, self._create_regional_subplot),
+            (trend_data, self._create_trend_subplot),
+            (class_data, self._create_class_subplot),
+        )
+        if self._dashboard_canvas is None:
+            fig = Figure(figsize=(20, 12), layout='constrained')
+            self._dashboard_axes = [fig.add_subplot(2, 2, i + 1) for i in range(4)]
+            self._dashboard_canvas = FigureCanvasQTAgg(fig)
+            self._dashboard_hashes = [None] * len(panels)
+
+        for i, (data, draw) in enumerate(panels):
+            digest = self._hash_inputs(data)
+            if digest == self._dashboard_hashes[i]:
+                continue
+            ax = self._dashboard_axes[i]
+            ax.clear()
+            draw(ax, data)
+            self._dashboard_hashes[i] = digest
+
+        self._dashboard_canvas.draw_idle()
+        return self._dashboard_canvas
+
+    def create_summary_dashboard_async(
+        self,
+        market_share: Dict[str, float],
+        regional_data: pd.DataFrame,
+        trend_data: pd.DataFrame,
+        class_data: pd.DataFrame,
+        on_ready,
+        on_error=None
+    ):
+        """Build the summary dashboard without blocking the GUI thread.
+
+        The Figure is assembled on the global thread pool; back on the
+        GUI thread only the cheap canvas wrap runs before on_ready
+        receives the finished FigureCanvasQTAgg.
+        """
+        worker = _DashboardWorker(
+            lambda: self._build_dashboard_figure(
+                market_share, regional_data, trend_data, class_data
+            )
+        )
+        worker.signals.finished.connect(lambda fig: on_ready(FigureCanvasQTAgg(fig)))
+        if on_error is not None:
+            worker.signals.error.connect(on_error)
+        QThreadPool.globalInstance().start(worker)
\ No newline at end of file